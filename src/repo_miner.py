@@ -11,135 +11,554 @@ Sub-commands:
     - fetch-issues
 """
 
+from __future__ import annotations
+
 import argparse
+import csv
+import functools
+import math
 import os
-from functools import reduce
+import sys
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+
+# pandas, pyarrow, PyGithub and friends are imported by the functions using them,
+# so `--help`, argument errors and `summarize` don't pay for the unused ones
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    from github import Commit, Github, Issue
+    from github.Repository import Repository
+    from github.Requester import Requester
+
+type CommitRow = tuple[str, str | None, str | None, str | None, str]
+type IssueRow = tuple[int, int, str, str, str, str, str | None, int]
+
+_COMMIT_COLUMNS = ["sha", "author", "email", "date", "message"]
+_ISSUE_COLUMNS = [
+    "id",
+    "number",
+    "title",
+    "user",
+    "state",
+    "created_at",
+    "closed_at",
+    "comments",
+]
+# Derived from created_at/closed_at once the issues are fetched
+_DURATION_COLUMN = "open_duration_days"
+
+# Column types of the CSVs written by fetch-commits/fetch-issues for `csv_to_df`
+# Repetitive columns are stored as categories: int codes plus one copy of each value
+_COMMIT_CATEGORIES = {"author": "category", "email": "category"}
+# A list is a categorical with exactly those values, see `_pandas_dtypes`
+_ISSUE_CATEGORIES = {"user": "category", "state": ["open", "closed"]}
+
+_COMMITS_SCHEMA = {
+    "sha": "string[pyarrow]",
+    **_COMMIT_CATEGORIES,
+    "date": "datetime",
+    "message": "string[pyarrow]",
+}
+_ISSUES_SCHEMA = {
+    "id": "int64",
+    "number": "int64",
+    "title": "string[pyarrow]",
+    **_ISSUE_CATEGORIES,
+    "created_at": "datetime",
+    "closed_at": "datetime",
+    "comments": "int64",
+    "open_duration_days": "float64",
+}
+
+_GRAPHQL_PAGE_SIZE = 100
+
+_COMMITS_QUERY = """
+query ($owner: String!, $name: String!, $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $first, after: $cursor) {
+            pageInfo { endCursor hasNextPage }
+            nodes { oid message author { name email date } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+_ISSUES_QUERY = """
+query (
+  $owner: String!, $name: String!, $first: Int!, $cursor: String, $states: [IssueState!]
+) {
+  repository(owner: $owner, name: $name) {
+    issues(
+      first: $first, after: $cursor, states: $states,
+      orderBy: { field: CREATED_AT, direction: DESC }
+    ) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        databaseId number title state createdAt closedAt
+        author { login }
+        comments { totalCount }
+      }
+    }
+  }
+}
+"""
+
+_GRAPHQL_STATES = {"all": None, "open": ["OPEN"], "closed": ["CLOSED"]}
+
+# Login GitHub shows for deleted accounts
+_GHOST_LOGIN = "ghost"
+
+_SEARCH_RESULT_LIMIT = 1000
 
-import pandas as pd
-from dotenv import find_dotenv, load_dotenv
-from github import Auth, Commit, Github, Issue
+# Concurrent REST page requests; GitHub penalizes bursts with secondary rate limits
+_PAGE_WORKERS = 8
 
-type CommitRecords = dict[str, list]
-type IssueRecords = dict[str, list]
 
+def _fetch_all_pages(
+    pages,
+    max_items: int | None,
+    requester: Requester,
+    max_workers: int = _PAGE_WORKERS,
+) -> Iterator[list]:
+    """Fetches the pages of a REST listing concurrently instead of one after another
 
-def _get_commits_from_repo(github: Github, repo_name: str, max_commits: int | None):
-    """Converts iterator to lists to prefetch all lists
+    The first page tells the page size and `totalCount` (parsed from the `Link`
+    header) tells how many pages are left, which are then requested in parallel.
+    No more workers are started than the rate limit has requests left, and rate
+    limit responses are retried with backoff by the PyGithub requester.
+
+    Pages are yielded in order as soon as they arrive, with at most `workers`
+    requested ahead of the consumer, so a caller writing them out never holds
+    more than a few pages of the listing.
 
     Args:
-        github (Github): Github client to fetch from
-        repo_name (str): name of the repository to fetch commits from
-        max_commits (int | None): maximum number of commits, None is no limit and fetches all commits
+        pages (PaginatedList): listing returned by PyGithub
+        max_items (int | None): maximum number of items, None is no limit and fetches all items
+        requester (Requester): requester that issued `pages`, its rate limit caps the workers
+        max_workers (int): maximum number of pages requested at the same time
 
     Returns:
-        PaginatedList[Commit]: list of commits
+        Iterator[list]: pages of the listing in their original order
     """
-    if max_commits is None:
-        return github.get_repo(repo_name).get_commits()
-    return github.get_repo(repo_name).get_commits()[:max_commits]
+    if not hasattr(pages, "get_page"):  # plain iterable, stops after `max_items`
+        yield list(islice(pages, max_items))
+        return
+
+    first = pages.get_page(0)
+    per_page = len(first)
+    if per_page == 0 or (max_items is not None and max_items <= per_page):
+        yield first[:max_items]
+        return
+
+    total = pages.totalCount
+    if max_items is not None:
+        total = min(total, max_items)
+    page_count = math.ceil(total / per_page)
+    yield first[:total]
+    if page_count <= 1:
+        return
+
+    workers = min(max_workers, page_count - 1)
+    # Never burst past the requests left this hour (-1 until GitHub reported it)
+    remaining, _ = requester.rate_limiting
+    if remaining >= 0:
+        workers = max(1, min(workers, remaining))
+
+    page_numbers = iter(range(1, page_count))
+    left = total - per_page
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # one request in flight per worker, the next is sent as a page is taken
+        pending = deque(
+            pool.submit(pages.get_page, n) for n in islice(page_numbers, workers)
+        )
+        while pending:
+            page = pending.popleft().result()
+            for n in islice(page_numbers, 1):
+                pending.append(pool.submit(pages.get_page, n))
+            yield page[:left]
+            left -= len(page)
 
 
-def _conv_commits_to_record(commits: list[Commit.Commit]) -> CommitRecords:
+def _raw_payload(obj) -> dict:
+    """Returns the JSON PyGithub received for `obj` in the listing response
+
+    Unlike the public `raw_data` property (and any attribute missing from the
+    payload), this never completes the object with an extra REST request.
+
+    Args:
+        obj (GithubObject): object taken from a PaginatedList
+
+    Returns:
+        dict: the decoded JSON of the object
     """
-    Converts list of commits to records supported for dataframe.
+    return obj._rawData
+
+
+def _intern(value: str | None) -> str | None:
+    """Returns the one shared copy of `value`, so repeated authors/states are stored once"""
+    return value if value is None else sys.intern(value)
+
+
+def _identity(value: str | None) -> str | None:
+    """Returns `value` as is, for rows written out right away with nothing to share"""
+    return value
+
+
+def _open_duration_days(created_at: str, closed_at: str | None) -> int | None:
+    """Whole days between two ISO-8601 timestamps, None while the issue is open"""
+    if closed_at is None:
+        return None
+    return (datetime.fromisoformat(closed_at) - datetime.fromisoformat(created_at)).days
+
+
+def _open_duration_days_column(created_at: pd.Series, closed_at: pd.Series):
+    """Vectorized `_open_duration_days` over whole columns, NaN while the issue is open
+
+    Takes the columns parsed by `_as_datetime` and subtracts them as datetime64
+    arrays instead of parsing two strings per issue in Python. Open issues and
+    unparsable timestamps are NaT, so their duration is NaN.
+    """
+    return (closed_at - created_at).dt.days.astype("float64")
+
+
+def _get_commits_from_repo(
+    repo: Repository, max_commits: int | None
+) -> Iterator[Commit.Commit]:
+    """Prefetches the pages of commits concurrently, yielding them as they arrive
 
     Args:
-    - Commits: list[Commit] list of commits to convert
+        repo (Repository): repository to fetch commits from
+        max_commits (int | None): maximum number of commits, None is no limit and fetches all commits
 
-    Returns: CommitRecords dictionary of list as attribute values
+    Returns:
+        Iterator[Commit]: commits, newest first
     """
+    return chain.from_iterable(
+        _fetch_all_pages(repo.get_commits(), max_commits, repo.requester)
+    )
 
-    def merge(raw_dict: CommitRecords, commit: Commit.Commit):
-        raw_dict["sha"].append(commit.sha)
-        raw_dict["author"].append(commit.commit.author.name)
-        raw_dict["email"].append(commit.commit.author.email)
-        raw_dict["date"].append(commit.commit.author.date.isoformat())
-        raw_dict["message"].append(commit.commit.message)
-        return raw_dict
 
-    records: CommitRecords = {
-        "sha": [],
-        "author": [],
-        "email": [],
-        "date": [],
-        "message": [],
-    }
-    return reduce(merge, commits, records)
+def _iter_commit_rows(
+    commits: Iterable[Commit.Commit], intern_strings: bool = False
+) -> Iterator[CommitRow]:
+    """
+    Converts commits to rows ordered like `_COMMIT_COLUMNS`.
+
+    Args:
+    - Commits: Iterable[Commit] commits to convert
+    - intern_strings: bool share one copy of repeated authors, for rows kept in a frame
+
+    Returns: Iterator[CommitRow] one tuple per commit
+    """
+    intern = _intern if intern_strings else _identity
+    for commit in commits:
+        raw = _raw_payload(commit)
+        git_commit = raw["commit"]
+        author = git_commit["author"]
+        yield (
+            raw["sha"],
+            intern(author["name"]),
+            intern(author["email"]),
+            author["date"],
+            git_commit["message"],
+        )
 
 
 def _get_issues_from_repo(
+    repo: Repository, state: str, max_issues: int | None
+) -> Iterator[Issue.Issue]:
+    """Prefetches the pages of issues concurrently, yielding them as they arrive
+
+    Args:
+        repo (Repository): repository to fetch issues from
+        state (str): state of issues to fetch (all, open, closed)
+        max_issues (int | None): maximum number of issues, None is no limit and fetches all issues
+
+    Returns:
+        Iterator[Issue]: issues, newest first
+    """
+    return chain.from_iterable(
+        _fetch_all_pages(repo.get_issues(state=state), max_issues, repo.requester)
+    )
+
+
+def _search_issues(github: Github, repo_name: str, state: str, max_issues: int | None):
+    """Prefetches issues through the search API, which leaves pull requests out
+
+    The search API only serves the first 1000 results, so this is only usable
+    when `max_issues` fits in that window. Its index can lag behind the issues
+    themselves and it allows 30 requests a minute, so it is opt-in only and
+    pages are requested one after another.
+
+    Args:
+        github (Github): Github client to fetch from
+        repo_name (str): name of the repository in owner/repo format
+        state (str): state of issues to fetch (all, open, closed)
+        max_issues (int | None): maximum number of issues to fetch
+
+    Returns:
+        list[Issue] | None: list of issues, newest first like `get_issues`, None
+        when GitHub reports the results as incomplete (the search timed out)
+    """
+    query = f"repo:{repo_name} is:issue"
+    if state != "all":
+        query += f" state:{state}"
+    results = github.search_issues(query, sort="created", order="desc")
+    # collected before returning: the completeness is only known after the last
+    # page, and at most 1000 results are held
+    issues = list(
+        chain.from_iterable(
+            _fetch_all_pages(results, max_issues, github.requester, max_workers=1)
+        )
+    )
+    if results.incomplete_results:
+        return None
+    return issues
+
+
+def _graphql_fetch(github: Github, query: str, variables: dict) -> dict:
+    """Runs a single GraphQL query through the client's requester
+
+    Args:
+        github (Github): Github client whose auth and retry settings are reused
+        query (str): GraphQL query string
+        variables (dict): variables passed along with the query
+
+    Returns:
+        dict: the `data` object of the GraphQL response
+    """
+    _, response = github.requester.graphql_query(query, variables)
+    return response["data"]
+
+
+def _get_commit_nodes_graphql(
+    github: Github, repo_name: str, max_commits: int | None
+) -> Iterator[list[dict]]:
+    """Fetches commits of the default branch through GraphQL, 100 per request
+
+    Args:
+        github (Github): Github client to fetch from
+        repo_name (str): name of the repository in owner/repo format
+        max_commits (int | None): maximum number of commits, None is no limit and fetches all commits
+
+    Returns:
+        Iterator[list[dict]]: the commit nodes of each response page
+    """
+    owner, name = repo_name.split("/", 1)
+    cursor = None
+    remaining = max_commits
+    while remaining is None or remaining > 0:
+        first = (
+            _GRAPHQL_PAGE_SIZE
+            if remaining is None
+            else min(_GRAPHQL_PAGE_SIZE, remaining)
+        )
+        data = _graphql_fetch(
+            github,
+            _COMMITS_QUERY,
+            {"owner": owner, "name": name, "first": first, "cursor": cursor},
+        )
+        branch = data["repository"]["defaultBranchRef"]
+        if branch is None:  # empty repository
+            break
+        history = branch["target"]["history"]
+        yield history["nodes"]
+        if remaining is not None:
+            remaining -= len(history["nodes"])
+        if not history["pageInfo"]["hasNextPage"]:
+            break
+        cursor = history["pageInfo"]["endCursor"]
+
+
+def _get_issue_nodes_graphql(
     github: Github, repo_name: str, state: str, max_issues: int | None
-):
-    """Converts iterator to lists to prefetch all lists
+) -> Iterator[list[dict]]:
+    """Fetches issues through GraphQL, 100 per request
+
+    The `issues` connection never contains pull requests, so nothing has to be
+    filtered out afterwards.
 
     Args:
         github (Github): Github client to fetch from
-        repo_name (str): name of the repository to fetch issues from
+        repo_name (str): name of the repository in owner/repo format
         state (str): state of issues to fetch (all, open, closed)
         max_issues (int | None): maximum number of issues, None is no limit and fetches all issues
 
     Returns:
-        PaginatedList[Issue]: list of issues
+        Iterator[list[dict]]: the issue nodes of each response page
+    """
+    owner, name = repo_name.split("/", 1)
+    cursor = None
+    remaining = max_issues
+    while remaining is None or remaining > 0:
+        first = (
+            _GRAPHQL_PAGE_SIZE
+            if remaining is None
+            else min(_GRAPHQL_PAGE_SIZE, remaining)
+        )
+        data = _graphql_fetch(
+            github,
+            _ISSUES_QUERY,
+            {
+                "owner": owner,
+                "name": name,
+                "first": first,
+                "cursor": cursor,
+                "states": _GRAPHQL_STATES[state],
+            },
+        )
+        issues = data["repository"]["issues"]
+        yield issues["nodes"]
+        if remaining is not None:
+            remaining -= len(issues["nodes"])
+        if not issues["pageInfo"]["hasNextPage"]:
+            break
+        cursor = issues["pageInfo"]["endCursor"]
+
+
+def _commit_nodes_table(nodes: list[dict]) -> pa.Table:
+    """Normalizes GraphQL commit nodes into a table with `_COMMIT_COLUMNS`
+
+    The nested nodes are converted by Arrow in C++ instead of a Python loop per
+    commit. Both the CSV rows and the DataFrame of the GraphQL path come from it.
+    """
+    import pyarrow as pa
+
+    author = pa.struct(
+        [("name", pa.string()), ("email", pa.string()), ("date", pa.string())]
+    )
+    schema = pa.schema(
+        [("oid", pa.string()), ("message", pa.string()), ("author", author)]
+    )
+    table = pa.Table.from_pylist(nodes, schema=schema).flatten()
+    return table.select(
+        ["oid", "author.name", "author.email", "author.date", "message"]
+    ).rename_columns(_COMMIT_COLUMNS)
+
+
+def _issue_nodes_table(nodes: list[dict]) -> pa.Table:
+    """Normalizes GraphQL issue nodes into a table with `_ISSUE_COLUMNS`
+
+    Same as `_commit_nodes_table`, with the state lowercased like the REST API
+    sends it.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    schema = pa.schema(
+        [
+            ("databaseId", pa.int64()),
+            ("number", pa.int64()),
+            ("title", pa.string()),
+            ("state", pa.string()),
+            ("createdAt", pa.string()),
+            ("closedAt", pa.string()),
+            ("author", pa.struct([("login", pa.string())])),
+            ("comments", pa.struct([("totalCount", pa.int64())])),
+        ]
+    )
+    table = pa.Table.from_pylist(nodes, schema=schema).flatten()
+    return pa.table(
+        [
+            table["databaseId"],
+            table["number"],
+            table["title"],
+            # Deleted accounts come back as a null author
+            pc.fill_null(table["author.login"], _GHOST_LOGIN),
+            pc.utf8_lower(table["state"]),
+            table["createdAt"],
+            table["closedAt"],
+            table["comments.totalCount"],
+        ],
+        names=_ISSUE_COLUMNS,
+    )
+
+
+def _graphql_tables_or_none(
+    node_pages: Iterator[list[dict]], to_table
+) -> Iterator[pa.Table] | None:
+    """Normalizes each page of nodes, None if the first GraphQL request fails
+
+    The first page is fetched right away so the caller can still switch to REST.
+    Errors after it are raised, rows may already have been handed out by then.
     """
-    if max_issues is None:
-        return github.get_repo(repo_name).get_issues(state=state)
-    return github.get_repo(repo_name).get_issues(state=state)[:max_issues]
+    from github import GithubException
+
+    try:
+        first = next(node_pages, None)
+    except GithubException:
+        return None
+    if first is None:
+        return iter(())
+    return (to_table(nodes) for nodes in chain([first], node_pages))
+
 
+def _table_rows(tables: Iterable[pa.Table]) -> Iterator[tuple]:
+    """Yields the rows of `tables` as tuples, one table at a time"""
+    for table in tables:
+        yield from zip(*(column.to_pylist() for column in table.columns))
 
-def _conv_issues_to_record(issues: list[Issue.Issue]) -> IssueRecords:
+
+def _tables_frame(tables: Iterable[pa.Table], to_table) -> pd.DataFrame:
+    """Concatenates `tables` into one DataFrame without copying column by column"""
+    import pyarrow as pa
+
+    tables = list(tables) or [to_table([])]
+    return pa.concat_tables(tables).to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _iter_issue_rows(
+    issues: Iterable[Issue.Issue], intern_strings: bool = False
+) -> Iterator[IssueRow]:
     """
-    Converts list of issues to records supported for dataframe.
+    Converts issues to rows ordered like `_ISSUE_COLUMNS`, skipping pull requests.
 
     Args:
-    - Issues: list[Issue] list of issues to convert
-
-    Returns: IssueRecords dictionary of list as attribute values
-    """
-
-    def merge(raw_dict: IssueRecords, issue: Issue.Issue) -> IssueRecords:
-        # Skip pull requests (they have a pull_request attribute)
-        if hasattr(issue, "pull_request") and issue.pull_request is not None:
-            return raw_dict
-
-        # Calculate open_duration_days
-        open_duration_days = None
-        if issue.closed_at is not None:
-            created = issue.created_at
-            closed = issue.closed_at
-            open_duration_days = (closed - created).days
-
-        raw_dict["id"].append(issue.id)
-        raw_dict["number"].append(issue.number)
-        raw_dict["title"].append(issue.title)
-        raw_dict["user"].append(issue.user.login)
-        raw_dict["state"].append(issue.state)
-        raw_dict["created_at"].append(issue.created_at.isoformat())
-        raw_dict["closed_at"].append(
-            issue.closed_at.isoformat() if issue.closed_at else None
+    - Issues: Iterable[Issue] issues to convert
+    - intern_strings: bool share one copy of repeated users/states, for rows kept in a frame
+
+    Returns: Iterator[IssueRow] one tuple per issue
+    """
+    intern = _intern if intern_strings else _identity
+    for issue in issues:
+        raw = _raw_payload(issue)
+        # Skip pull requests (their listing entry has a pull_request key)
+        if "pull_request" in raw:
+            continue
+
+        yield (
+            raw["id"],
+            raw["number"],
+            raw["title"],
+            intern(raw["user"]["login"]),
+            intern(raw["state"]),
+            raw["created_at"],
+            raw["closed_at"],
+            raw["comments"],
         )
-        raw_dict["comments"].append(issue.comments)
-        raw_dict["open_duration_days"].append(open_duration_days)
-        return raw_dict
-
-    records: IssueRecords = {
-        "id": [],
-        "number": [],
-        "title": [],
-        "user": [],
-        "state": [],
-        "created_at": [],
-        "closed_at": [],
-        "comments": [],
-        "open_duration_days": [],
-    }
-    return reduce(merge, issues, records)
 
 
-def fetch_commits(repo_name: str, max_commits: int | None = None) -> pd.DataFrame:
-    """
-    Fetch up to `max_commits` from the specified GitHub repository.
-    Returns a DataFrame with columns: sha, author, email, date, message.
+@functools.cache
+def _github_client() -> Github:
+    """GitHub client authenticated with the GITHUB_TOKEN environment variable
+
+    Built once and shared, so every fetch reuses the same keep-alive connections.
     """
+    from github import Auth, Github
+    from github.GithubRetry import GithubRetry
+
     # 1) Read GitHub token from environment
     ACCESS_TOKEN = os.environ.get("GITHUB_TOKEN")
     if ACCESS_TOKEN is None:
@@ -148,61 +567,359 @@ def fetch_commits(repo_name: str, max_commits: int | None = None) -> pd.DataFram
         )
     auth = Auth.Token(ACCESS_TOKEN)
 
-    # 2) Initialize GitHub client and get the repo
-    g = Github(auth=auth)
+    # 2) Initialize GitHub client
+    # lazy: listings only need the repo URL, skip the metadata GET /repos/{name}
+    # (get_repo honours the client-wide flag from PyGithub 2.9.0 on)
+    # per_page: 100 is the REST maximum, a third of the default 30's page count
+    # pool_size: one connection per worker of `_fetch_all_pages`
+    return Github(
+        auth=auth,
+        lazy=True,
+        per_page=100,
+        retry=GithubRetry(total=5, backoff_factor=2),
+        pool_size=_PAGE_WORKERS,
+    )
+
+
+def _commit_rows(
+    repo_name: str,
+    max_commits: int | None,
+    graphql: bool,
+    intern_strings: bool = False,
+) -> Iterator[CommitRow]:
+    """Fetches up to `max_commits` and returns them as rows ordered like `_COMMIT_COLUMNS`
+
+    `intern_strings` is for rows kept in a frame, streamed rows don't need it.
+    """
+    g = _github_client()
+
+    if graphql:
+        tables = _graphql_tables_or_none(
+            _get_commit_nodes_graphql(g, repo_name, max_commits), _commit_nodes_table
+        )
+        if tables is not None:
+            return _table_rows(tables)
 
     # 3) Fetch commit objects (paginated by PyGitHub)
-    commits: list[Commit.Commit] = list(
-        _get_commits_from_repo(g, repo_name, max_commits)
-    )  # pyright: ignore[reportAssignmentType]
+    repo = g.get_repo(repo_name)
+    commits = _get_commits_from_repo(repo, max_commits)
+
+    # 4) Normalize each commit into a row
+    return _iter_commit_rows(commits, intern_strings)
+
+
+def _issue_rows(
+    repo_full_name: str,
+    state: str,
+    max_issues: int | None,
+    graphql: bool,
+    search: bool = False,
+    intern_strings: bool = False,
+) -> Iterator[IssueRow]:
+    """Fetches up to `max_issues` and returns them as rows ordered like `_ISSUE_COLUMNS`
+
+    `intern_strings` is for rows kept in a frame, streamed rows don't need it.
+    """
+    g = _github_client()
+
+    if graphql:
+        tables = _graphql_tables_or_none(
+            _get_issue_nodes_graphql(g, repo_full_name, state, max_issues),
+            _issue_nodes_table,
+        )
+        if tables is not None:
+            return _table_rows(tables)
+
+    # 3) Fetch issue objects (paginated by PyGitHub)
+    issues: Iterable[Issue.Issue] | None = None
+    if search and max_issues is not None and max_issues <= _SEARCH_RESULT_LIMIT:
+        # bounded fetch: let the server drop pull requests instead of paying for them
+        issues = _search_issues(g, repo_full_name, state, max_issues)
+    if issues is None:  # no search requested, or its results were incomplete
+        repo = g.get_repo(repo_full_name)
+        issues = _get_issues_from_repo(repo, state, max_issues)
+
+    # 4) Normalize each issue into a row
+    return _iter_issue_rows(issues, intern_strings)
+
+
+def _pandas_dtypes(schema: dict[str, str | list[str]]) -> dict:
+    """Resolves the list entries of `schema` into categoricals of those values"""
+    import pandas as pd
+
+    return {
+        c: pd.CategoricalDtype(t) if isinstance(t, list) else t
+        for c, t in schema.items()
+    }
+
+
+def _apply_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """Casts the columns of `df` to `schema`, "datetime" columns stay ISO-8601 strings"""
+    return df.astype(
+        _pandas_dtypes(
+            {c: t for c, t in schema.items() if t != "datetime" and c in df.columns}
+        )
+    )
+
+
+def _empty_frame(columns: list[str], schema: dict) -> pd.DataFrame:
+    """Zero-row frame of `columns` typed like a fetched one under `schema`"""
+    import pandas as pd
+
+    dtypes = _pandas_dtypes(schema)
+    # fetched timestamps are GitHub's ISO strings, see `_apply_schema`
+    return pd.DataFrame(
+        {
+            c: pd.Series(dtype="str" if dtypes[c] == "datetime" else dtypes[c])
+            for c in columns
+        }
+    )
+
+
+@functools.cache
+def _empty_commits_frame() -> pd.DataFrame:
+    """Zero-row frame typed like `fetch_commits`'s, shared so copy before use"""
+    return _empty_frame(_COMMIT_COLUMNS, _COMMITS_SCHEMA)
 
-    # 4) Normalize each commit into a record dict
-    records = _conv_commits_to_record(commits)
 
-    # 5) Build DataFrame from records
-    return pd.DataFrame(records)
+@functools.cache
+def _empty_issues_frame() -> pd.DataFrame:
+    """Zero-row frame typed like `fetch_issues`'s, shared so copy before use"""
+    return _empty_frame([*_ISSUE_COLUMNS, _DURATION_COLUMN], _ISSUES_SCHEMA)
+
+
+def fetch_commits(
+    repo_name: str,
+    max_commits: int | None = None,
+    graphql: bool = False,
+    parse_dates: bool = False,
+) -> pd.DataFrame:
+    """
+    Fetch up to `max_commits` from the specified GitHub repository.
+    Returns a DataFrame with columns: sha, author, email, date, message.
+    With `graphql`, commits are pulled 100 at a time from the GraphQL API,
+    falling back to REST if the first GraphQL request fails.
+    With `parse_dates`, date holds UTC timestamps instead of ISO-8601 strings.
+    """
+    import pandas as pd
+
+    df = None
+    if graphql:
+        tables = _graphql_tables_or_none(
+            _get_commit_nodes_graphql(_github_client(), repo_name, max_commits),
+            _commit_nodes_table,
+        )
+        if tables is not None:  # otherwise fetched through REST below
+            df = _tables_frame(tables, _commit_nodes_table)
+    if df is None:
+        rows = _commit_rows(repo_name, max_commits, graphql=False, intern_strings=True)
+        first = next(rows, None)
+        if first is None:
+            df = _empty_commits_frame().copy()
+            return _parse_dates(df, _COMMITS_SCHEMA) if parse_dates else df
+        # Tuples go into a single constructor call, no per-row append or dicts
+        df = pd.DataFrame.from_records(chain([first], rows), columns=_COMMIT_COLUMNS)
+    df = _apply_schema(df, _COMMITS_SCHEMA)
+    return _parse_dates(df, _COMMITS_SCHEMA) if parse_dates else df
 
 
 def fetch_issues(
-    repo_full_name: str, state: str = "all", max_issues: int | None = None
+    repo_full_name: str,
+    state: str = "all",
+    max_issues: int | None = None,
+    graphql: bool = False,
+    parse_dates: bool = False,
+    search: bool = False,
 ) -> pd.DataFrame:
     """
     Fetch up to `max_issues` from the specified GitHub repository.
     Returns a DataFrame with columns: id, number, title, user, state, created_at, closed_at, comments, open_duration_days.
     Skips pull requests.
+    With `graphql`, issues are pulled 100 at a time from the GraphQL API,
+    falling back to REST if the first GraphQL request fails.
+    With `parse_dates`, created_at/closed_at hold the UTC timestamps the duration
+    was computed from instead of ISO-8601 strings.
+    With `search`, a `max_issues` of up to 1000 is fetched through the search API,
+    which leaves pull requests out, falling back to the issue listing if GitHub
+    reports incomplete results.
     """
-    # 1) Read GitHub token from environment
-    ACCESS_TOKEN = os.environ.get("GITHUB_TOKEN")
-    if ACCESS_TOKEN is None:
-        raise KeyError(
-            "GITHUB_TOKEN was not found. Make sure the environment file is properly loaded."
+    import pandas as pd
+
+    df = None
+    if graphql:
+        tables = _graphql_tables_or_none(
+            _get_issue_nodes_graphql(
+                _github_client(), repo_full_name, state, max_issues
+            ),
+            _issue_nodes_table,
         )
-    auth = Auth.Token(ACCESS_TOKEN)
+        if tables is not None:  # otherwise fetched through REST below
+            df = _tables_frame(tables, _issue_nodes_table)
+    if df is None:
+        rows = _issue_rows(
+            repo_full_name,
+            state,
+            max_issues,
+            graphql=False,
+            search=search,
+            intern_strings=True,
+        )
+        first = next(rows, None)
+        if first is None:
+            df = _empty_issues_frame().copy()
+            return _parse_dates(df, _ISSUES_SCHEMA) if parse_dates else df
+        # Tuples go into a single constructor call, no per-row append or dicts
+        df = pd.DataFrame.from_records(chain([first], rows), columns=_ISSUE_COLUMNS)
+    # Parsed once, for the duration and (with `parse_dates`) the returned columns
+    created_at = _as_datetime(df["created_at"])
+    closed_at = _as_datetime(df["closed_at"])
+    df[_DURATION_COLUMN] = _open_duration_days_column(created_at, closed_at)
+    if parse_dates:
+        df["created_at"] = created_at
+        df["closed_at"] = closed_at
+    return _apply_schema(df, _ISSUES_SCHEMA)
 
-    # 2) Initialize GitHub client and get the repo
-    g = Github(auth=auth)
 
-    # 3) Fetch issue objects (paginated by PyGitHub)
-    issues: list[Issue.Issue] = list(
-        _get_issues_from_repo(g, repo_full_name, state, max_issues)
-    )  # pyright: ignore[reportAssignmentType]
+def _install_http_cache(out_path: str) -> None:
+    """Caches GitHub GET responses in a SQLite file next to `out_path`
+
+    Responses are kept as long as GitHub's Cache-Control allows and then
+    revalidated with their ETag/Last-Modified. An unchanged page comes back as
+    an empty 304, which doesn't count against the rate limit. The token is never
+    stored with the cached requests.
+    """
+    import requests_cache
+
+    cache_dir = os.path.dirname(os.path.abspath(out_path))
+    requests_cache.install_cache(
+        os.path.join(cache_dir, ".gh_cache"),
+        backend="sqlite",
+        allowable_methods=("GET",),
+        cache_control=True,
+    )
 
-    # 4) Normalize each issue into a record dict
-    records = _conv_issues_to_record(issues)
 
-    # 5) Build DataFrame from records
-    return pd.DataFrame(records)
+def _write_csv_rows(rows: Iterable[tuple], columns: list[str], out_path: str) -> int:
+    """Writes rows to `out_path` as they arrive and returns how many were written
 
+    Rows go to a temporary file next to `out_path` that only replaces it once
+    every row was written, a failed fetch leaves no partial CSV behind.
+    """
+    out_dir = os.path.dirname(os.path.abspath(out_path))
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=".csv.tmp")
+    try:
+        count = 0
+        with open(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        # mkstemp creates the file private, give it the mode `open` would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return count
+
+
+def _stream_commits_to_csv(
+    repo_name: str, max_commits: int | None, out_path: str, graphql: bool = False
+) -> int:
+    """Same as `fetch_commits(...).to_csv(out_path)` without building a DataFrame"""
+    rows = _commit_rows(repo_name, max_commits, graphql)
+    return _write_csv_rows(rows, _COMMIT_COLUMNS, out_path)
+
+
+def _stream_issues_to_csv(
+    repo_full_name: str,
+    state: str,
+    max_issues: int | None,
+    out_path: str,
+    graphql: bool = False,
+    search: bool = False,
+) -> int:
+    """Same as `fetch_issues(...).to_csv(out_path)` without building a DataFrame"""
+    rows = (
+        (*row, _open_duration_days(row[5], row[6]))
+        for row in _issue_rows(repo_full_name, state, max_issues, graphql, search)
+    )
+    return _write_csv_rows(rows, [*_ISSUE_COLUMNS, _DURATION_COLUMN], out_path)
+
+
+def _write_parquet(df: pd.DataFrame, schema: dict, out_path: str) -> int:
+    """Writes `df` to `out_path` as zstd Parquet and returns how many rows were written
+
+    "datetime" columns of `schema` are stored as timestamps, so reading the file
+    back needs no date parsing.
+    """
+    _parse_dates(df, schema)
+    df.to_parquet(out_path, engine="pyarrow", compression="zstd", index=False)
+    return len(df)
+
+
+def csv_to_df(path: str, schema: dict[str, str | list[str]] | None = None):
+    """Takes a path to csv and converts to pd.df
+
+    Parsing is done by the PyArrow engine. `schema` maps column names to dtypes,
+    "datetime" columns are parsed into timestamps while reading and lists are
+    categoricals of those values. Columns of the schema missing from the file
+    are ignored. Paths ending in .parquet are read as Parquet, which stores its
+    own column types.
+    """
+    import pandas as pd
 
-def csv_to_df(path: str):
-    """Takes a path to csv and converts to pd.df"""
     if not isinstance(path, str) or path.strip() == "":
         raise ValueError("`path` must be a non-empty string pointing to a CSV file")
     if not os.path.isabs(path):
         path = os.path.abspath(path)
     if not os.path.exists(path):
         raise FileNotFoundError(f"CSV file not found: {path}")
-    return pd.read_csv(path)
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, engine="pyarrow")
+    if schema is None:
+        return pd.read_csv(path, engine="pyarrow")
+
+    with open(path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    columns = _pandas_dtypes({c: t for c, t in schema.items() if c in header})
+    df = pd.read_csv(
+        path,
+        engine="pyarrow",
+        dtype={c: t for c, t in columns.items() if t != "datetime"},
+        parse_dates=[c for c, t in columns.items() if t == "datetime"],
+    )
+    # An all-empty column carries no offset to parse and comes back tz-naive
+    return _parse_dates(df, columns)
+
+
+def _as_datetime(column: pd.Series) -> pd.Series:
+    """Coerces a column to UTC datetime unless it was already parsed on read
+
+    Parsed by pandas' C ISO-8601 parser in one pass, `cache` converts each
+    distinct timestamp once. Unparsable values become NaT. Parsed columns without
+    a timezone are taken as UTC, so any two results can be subtracted.
+    """
+    import pandas as pd
+
+    if pd.api.types.is_datetime64_any_dtype(column):
+        if column.dt.tz is None:
+            return column.dt.tz_localize("UTC")
+        return column
+    return pd.to_datetime(
+        column, utc=True, format="ISO8601", errors="coerce", cache=True
+    )
+
+
+def _parse_dates(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """Replaces the "datetime" columns of `schema` in `df` with parsed timestamps"""
+    for c, t in schema.items():
+        if t == "datetime" and c in df.columns:
+            df[c] = _as_datetime(df[c])
+    return df
 
 
 def merge_and_summarize(commits_df, issues_df):
@@ -212,42 +929,43 @@ def merge_and_summarize(commits_df, issues_df):
         - Issue close rate (closed/total)
         - Average open duration for closed issues (in days)
     """
-    # Copy to avoid modifying original data
-    commits = commits_df.copy()
-    issues = issues_df.copy()
-
-    # 1) Normalize date/time columns to pandas datetime
-    commits["date"] = pd.to_datetime(commits["date"], errors="coerce")
-    issues["created_at"] = pd.to_datetime(issues["created_at"], errors="coerce")
-    issues["closed_at"] = pd.to_datetime(issues["closed_at"], errors="coerce")
+    import pandas as pd
 
-    # 2) Top 5 committers
-    top_committers = (
-        commits["author"].fillna("<unknown>").value_counts().head(5).to_dict()
-    )
+    # 1) Top 5 committers (missing authors are counted in place, no filled copy)
+    authors = commits_df["author"]
+    if isinstance(authors.dtype, pd.CategoricalDtype):
+        # Counted on the codes: ties keep their first-appearance order, as with
+        # plain values, instead of the alphabetical order of the categories
+        code_counts = pd.Series(authors.cat.codes).value_counts().head(5)
+        author_counts = [
+            (None if code == -1 else authors.cat.categories[code], count)
+            for code, count in code_counts.items()
+        ]
+    else:
+        author_counts = authors.value_counts(dropna=False).head(5).items()
+    top_committers = {
+        ("<unknown>" if pd.isna(author) else author): int(count)
+        for author, count in author_counts
+    }
 
-    # 3) Calculate issue close rate
-    total_issues = len(issues)
-    closed_issues = int((issues["state"].fillna("") == "closed").sum())
+    # 2) Calculate issue close rate (missing states never equal "closed")
+    total_issues = len(issues_df)
+    closed_issues = int(issues_df["state"].eq("closed").sum())
     close_rate = None
     if total_issues > 0:
         close_rate = closed_issues / total_issues
 
-    # 4) Compute average open duration (days) for closed issues
-    avg_open_days = None
-    if "open_duration_days" in issues.columns:
-        odays = pd.to_numeric(issues["open_duration_days"], errors="coerce")
-        avg_open_days = (
-            float(odays.dropna().mean()) if not odays.dropna().empty else None
-        )
+    # 3) Compute average open duration (days) for closed issues
+    # mean() skips NaN/NaT in the same pass, open issues drop out on their own
+    if "open_duration_days" in issues_df.columns:
+        durations = pd.to_numeric(issues_df["open_duration_days"], errors="coerce")
     else:
-        closed_mask = issues["closed_at"].notna() & issues["created_at"].notna()
-        if closed_mask.any():
-            durations = (
-                issues.loc[closed_mask, "closed_at"]
-                - issues.loc[closed_mask, "created_at"]
-            ).dt.days
-            avg_open_days = float(durations.mean())
+        # Only timestamps without a precomputed duration need parsing
+        created_at = _as_datetime(issues_df["created_at"])
+        closed_at = _as_datetime(issues_df["closed_at"])
+        durations = (closed_at - created_at).dt.days
+    mean_days = durations.mean()
+    avg_open_days = None if pd.isna(mean_days) else float(mean_days)
 
     # Print summary to stdout
     print("Top 5 committers:")
@@ -273,6 +991,16 @@ def merge_and_summarize(commits_df, issues_df):
     }
 
 
+def _load_env() -> None:
+    """Loads the environment file and checks that it was found"""
+    from dotenv import find_dotenv, load_dotenv
+
+    load_dotenv(find_dotenv())
+    print(os.environ.get("TEST_LOADED", "Environment NOT LOADED!"))
+    if os.environ.get("TEST_LOADED") is None:
+        raise KeyError("Environment NOT LOADED!")
+
+
 def main() -> None:
     """
     Parse command-line arguments and dispatch to sub-commands.
@@ -283,15 +1011,31 @@ def main() -> None:
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Sub-command: fetch-commits
-    c1 = subparsers.add_parser("fetch-commits", help="Fetch commits and save to CSV")
+    c1 = subparsers.add_parser(
+        "fetch-commits", help="Fetch commits and save to CSV/Parquet"
+    )
     c1.add_argument("--repo", required=True, help="Repository in owner/repo format")
     c1.add_argument(
         "--max", type=int, dest="max_commits", help="Max number of commits to fetch"
     )
-    c1.add_argument("--out", required=True, help="Path to output commits CSV")
+    c1.add_argument("--out", required=True, help="Path to output commits file")
+    c1.add_argument(
+        "--graphql", action="store_true", help="Fetch through the GraphQL API"
+    )
+    c1.add_argument(
+        "--no-cache", action="store_true", help="Don't cache HTTP responses on disk"
+    )
+    c1.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Format of the output file (default: csv)",
+    )
 
     # Sub-command: fetch-issues
-    c2 = subparsers.add_parser("fetch-issues", help="Fetch issues and save to CSV")
+    c2 = subparsers.add_parser(
+        "fetch-issues", help="Fetch issues and save to CSV/Parquet"
+    )
     c2.add_argument("--repo", required=True, help="Repository in owner/repo format")
     c2.add_argument(
         "--state",
@@ -302,7 +1046,24 @@ def main() -> None:
     c2.add_argument(
         "--max", type=int, dest="max_issues", help="Max number of issues to fetch"
     )
-    c2.add_argument("--out", required=True, help="Path to output issues CSV")
+    c2.add_argument("--out", required=True, help="Path to output issues file")
+    c2.add_argument(
+        "--graphql", action="store_true", help="Fetch through the GraphQL API"
+    )
+    c2.add_argument(
+        "--search",
+        action="store_true",
+        help="Fetch through the search API, without pull requests (needs --max <= 1000)",
+    )
+    c2.add_argument(
+        "--no-cache", action="store_true", help="Don't cache HTTP responses on disk"
+    )
+    c2.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Format of the output file (default: csv)",
+    )
 
     # Sub-command: summarize
     c3 = subparsers.add_parser("summarize", help="Summarizes github repo")
@@ -310,24 +1071,51 @@ def main() -> None:
     c3.add_argument("--issues", required=True, help="Path to issues list file(csv)")
 
     args = parser.parse_args()
+    # the search API only serves its first 1000 results, see `_search_issues`
+    if (
+        args.command == "fetch-issues"
+        and args.search
+        and (args.max_issues is None or args.max_issues > _SEARCH_RESULT_LIMIT)
+    ):
+        c2.error(f"--search needs a --max of at most {_SEARCH_RESULT_LIMIT}")
+
+    # Only fetching needs the GitHub token from the environment file
+    if args.command.startswith("fetch-"):
+        _load_env()
+        if not args.no_cache:
+            _install_http_cache(args.out)
 
     # Dispatch based on selected command
-    if args.command == "fetch-commits":
-        df = fetch_commits(args.repo, args.max_commits)
-        df.to_csv(args.out, index=False)
-        print(f"Saved {len(df)} commits to {args.out}")
+    if args.command == "fetch-commits" and args.format == "parquet":
+        df = fetch_commits(args.repo, args.max_commits, args.graphql, parse_dates=True)
+        count = _write_parquet(df, _COMMITS_SCHEMA, args.out)
+        print(f"Saved {count} commits to {args.out}")
+    elif args.command == "fetch-commits":
+        count = _stream_commits_to_csv(
+            args.repo, args.max_commits, args.out, args.graphql
+        )
+        print(f"Saved {count} commits to {args.out}")
+    elif args.command == "fetch-issues" and args.format == "parquet":
+        df = fetch_issues(
+            args.repo,
+            args.state,
+            args.max_issues,
+            args.graphql,
+            parse_dates=True,
+            search=args.search,
+        )
+        count = _write_parquet(df, _ISSUES_SCHEMA, args.out)
+        print(f"Saved {count} issues to {args.out}")
     elif args.command == "fetch-issues":
-        df = fetch_issues(args.repo, args.state, args.max_issues)
-        df.to_csv(args.out, index=False)
-        print(f"Saved {len(df)} issues to {args.out}")
+        count = _stream_issues_to_csv(
+            args.repo, args.state, args.max_issues, args.out, args.graphql, args.search
+        )
+        print(f"Saved {count} issues to {args.out}")
     elif args.command == "summarize":
-        commits_df, issues_df = csv_to_df(args.commits), csv_to_df(args.issues)
+        commits_df = csv_to_df(args.commits, _COMMITS_SCHEMA)
+        issues_df = csv_to_df(args.issues, _ISSUES_SCHEMA)
         merge_and_summarize(commits_df, issues_df)
 
 
 if __name__ == "__main__":
-    load_dotenv(find_dotenv())
-    print(os.environ.get("TEST_LOADED", "Environment NOT LOADED!"))
-    if os.environ.get("TEST_LOADED") is None:
-        raise KeyError("Environment NOT LOADED!")
     main()
@@ -1,16 +1,25 @@
 # tests/test_repo_miner.py
 
+import io
 from datetime import datetime, timedelta
 
 import pandas as pd
 import pytest
+import requests
+import requests_cache
+from github import GithubException
 
 import src.repo_miner as repo_miner
 
+# Fixed reference time, keeps the day arithmetic of the tests deterministic
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 # --- Helpers for dummy GitHub API objects ---
 
 
 class DummyAuthor:
+    __slots__ = ("date", "email", "name")
+
     def __init__(self, name, email, date):
         self.name = name
         self.email = email
@@ -18,23 +27,65 @@ class DummyAuthor:
 
 
 class DummyCommitCommit:
+    __slots__ = ("author", "message")
+
     def __init__(self, author, message):
         self.author = author
         self.message = message
 
 
+def iso(dt):
+    """Formats a datetime the way the GitHub REST API does."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ") if dt is not None else None
+
+
 class DummyCommit:
+    __slots__ = ("_rawData", "commit", "sha")
+
     def __init__(self, sha, author, email, date, message):
         self.sha = sha
         self.commit = DummyCommitCommit(DummyAuthor(author, email, date), message)
+        # listing payload as PyGithub keeps it
+        self._rawData = {
+            "sha": sha,
+            "commit": {
+                "author": {"name": author, "email": email, "date": iso(date)},
+                "message": message,
+            },
+        }
+
+
+def commit_stream(n):
+    """Lazily yields `n` commits alternating between two authors."""
+    base = [
+        DummyCommit("sha1", "Alice", "a@example.com", NOW, "Initial commit\nDetails"),
+        DummyCommit("sha2", "Bob", "b@example.com", NOW - timedelta(days=1), "Bug fix"),
+    ]
+    for i in range(n):
+        yield base[i % 2]
 
 
 class DummyUser:
+    __slots__ = ("login",)
+
     def __init__(self, login):
         self.login = login
 
 
 class DummyIssue:
+    __slots__ = (
+        "_rawData",
+        "closed_at",
+        "comments",
+        "created_at",
+        "id",
+        "number",
+        "pull_request",
+        "state",
+        "title",
+        "user",
+    )
+
     def __init__(
         self,
         id_,
@@ -57,6 +108,19 @@ class DummyIssue:
         self.comments = comments
         # attribute only on pull requests
         self.pull_request = DummyUser("pr") if is_pr else None
+        # listing payload as PyGithub keeps it
+        self._rawData = {
+            "id": id_,
+            "number": number,
+            "title": title,
+            "user": {"login": user},
+            "state": state,
+            "created_at": iso(created_at),
+            "closed_at": iso(closed_at),
+            "comments": comments,
+        }
+        if is_pr:
+            self._rawData["pull_request"] = {"url": "pr"}
 
 
 class DummyRepo:
@@ -67,37 +131,166 @@ class DummyRepo:
     ):
         self._commits = commits
         self._issues = issues
+        # issues per state, built once instead of filtered on every call
+        self._by_state = {
+            "all": list(issues),
+            "open": [i for i in issues if i.state == "open"],
+            "closed": [i for i in issues if i.state == "closed"],
+        }
+
+    @property
+    def requester(self):
+        # like PyGithub, objects share the requester of the client they came from
+        return gh_instance.requester
 
     def get_commits(self):
         return self._commits
 
     def get_issues(self, state="all"):
-        # filter by state
-        if state == "all":
-            return self._issues
-        return [i for i in self._issues if i.state == state]
+        self.last_state = state
+        return self._by_state[state]
+
+
+class DummyPaginatedList:
+    """Mimics the page access of PyGithub's PaginatedList."""
+
+    # only set on search results
+    incomplete_results = None
+
+    def __init__(self, items, per_page=100):
+        self._items = items
+        self._per_page = per_page
+        self.requested_pages = []
+
+    @property
+    def totalCount(self):
+        return len(self._items)
+
+    def get_page(self, page):
+        self.requested_pages.append(page)
+        start = page * self._per_page
+        return self._items[start : start + self._per_page]
+
+
+class DummyRequester:
+    """Serves pre-built GraphQL responses one page at a time."""
+
+    # (remaining, limit) as PyGithub reads it from the response headers
+    rate_limiting = (-1, -1)
+
+    def __init__(self, pages):
+        self._pages = list(pages)
+        self.calls = []
+
+    def graphql_query(self, query, variables):
+        self.calls.append(variables)
+        return {}, {"data": self._pages.pop(0)}
+
+
+def commit_history_page(nodes, end_cursor=None):
+    return {
+        "repository": {
+            "defaultBranchRef": {
+                "target": {
+                    "history": {
+                        "pageInfo": {
+                            "endCursor": end_cursor,
+                            "hasNextPage": end_cursor is not None,
+                        },
+                        "nodes": nodes,
+                    }
+                }
+            }
+        }
+    }
+
+
+def issues_page(nodes, end_cursor=None):
+    return {
+        "repository": {
+            "issues": {
+                "pageInfo": {
+                    "endCursor": end_cursor,
+                    "hasNextPage": end_cursor is not None,
+                },
+                "nodes": nodes,
+            }
+        }
+    }
+
+
+# Closed and open GraphQL issue nodes, the open one by a deleted ("ghost") author
+ISSUE_NODES = [
+    {
+        "databaseId": 1,
+        "number": 1,
+        "title": "Closed issue",
+        "state": "CLOSED",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "closedAt": "2025-01-08T00:00:00Z",
+        "author": {"login": "alice"},
+        "comments": {"totalCount": 2},
+    },
+    {
+        "databaseId": 2,
+        "number": 2,
+        "title": "Open issue",
+        "state": "OPEN",
+        "createdAt": "2025-01-02T00:00:00Z",
+        "closedAt": None,
+        "author": None,
+        "comments": {"totalCount": 0},
+    },
+]
 
 
 class DummyGithub:
     _repo: DummyRepo
+    requester: DummyRequester
+    # what search results report as `incomplete_results`
+    search_incomplete = False
 
     def __init__(self, token):
         assert token == "fake-token"
+        self.requester = DummyRequester([])
+        # (query, sort, order) of the latest `search_issues` call
+        self.last_search = None
 
     def get_repo(self, repo_name):
         # ignore repo_name; return repo set in test fixture
         return self._repo
 
+    def search_issues(self, query, sort=None, order=None):
+        # the search API leaves pull requests out server-side
+        self.last_search = (query, sort, order)
+        issues = [i for i in self._repo._issues if i.pull_request is None]
+        if "state:" in query:
+            state = query.split("state:")[1]
+            issues = [i for i in issues if i.state == state]
+        results = DummyPaginatedList(issues)
+        results.incomplete_results = self.search_incomplete
+        return results
+
+
+@pytest.fixture(scope="session", autouse=True)
+def patch_env_and_github():
+    # Patched once for the whole run, tests only swap the repo they fetch from
+    with pytest.MonkeyPatch.context() as mp:
+        # Set fake token
+        mp.setenv("GITHUB_TOKEN", "fake-token")
+        # Patch the symbol that repo_miner uses
+        mp.setattr("github.Github", lambda *a, **kw: gh_instance)
+
+        # Return instance so tests can use it if needed
+        yield gh_instance
+
 
 @pytest.fixture(autouse=True)
-def patch_env_and_github(monkeypatch):
-    global gh_instance
-    # Set fake token
-    monkeypatch.setenv("GITHUB_TOKEN", "fake-token")
-    # Patch the symbol that repo_miner uses
-    monkeypatch.setattr(repo_miner, "Github", lambda *a, **kw: gh_instance)
-
-    # Return instance so tests can use it if needed
+def reset_github():
+    gh_instance._repo = DummyRepo([], [])
+    gh_instance.last_search = None
+    # Drop the client a previous test may have built
+    repo_miner._github_client.cache_clear()
     return gh_instance
 
 
@@ -109,10 +302,9 @@ gh_instance = DummyGithub("fake-token")
 # An example test case
 def test_fetch_commits_basic(monkeypatch):
     # Setup dummy commits
-    now = datetime.now()
     commits = [
-        DummyCommit("sha1", "Alice", "a@example.com", now, "Initial commit\nDetails"),
-        DummyCommit("sha2", "Bob", "b@example.com", now - timedelta(days=1), "Bug fix"),
+        DummyCommit("sha1", "Alice", "a@example.com", NOW, "Initial commit\nDetails"),
+        DummyCommit("sha2", "Bob", "b@example.com", NOW - timedelta(days=1), "Bug fix"),
     ]
     gh_instance._repo = DummyRepo(commits, [])
 
@@ -120,23 +312,20 @@ def test_fetch_commits_basic(monkeypatch):
     assert list(df.columns) == ["sha", "author", "email", "date", "message"]
     assert len(df) == 2
     assert df.iloc[0]["message"] == "Initial commit\nDetails"
+    assert isinstance(df["author"].dtype, pd.CategoricalDtype)
+    assert df["sha"].dtype == pd.StringDtype("pyarrow")
 
 
-def test_fetch_commits_limit(monkeypatch):
+# no kwargs exercises the default max_commits
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [({"max_commits": 20}, 20), ({}, 200), ({"max_commits": None}, 200)],
+)
+def test_fetch_commits_limit(kwargs, expected):
     """Test that fetch_commits respects the max_commits limit."""
-    now = datetime.now()
-    commits = [
-        DummyCommit("sha1", "Alice", "a@example.com", now, "Initial commit\nDetails"),
-        DummyCommit("sha2", "Bob", "b@example.com", now - timedelta(days=1), "Bug fix"),
-    ] * 100
-    gh_instance._repo = DummyRepo(commits, [])
-
-    df = repo_miner.fetch_commits("octocat/Hello-World", 20)
-    assert df["sha"].count() == 20
-    df = repo_miner.fetch_commits("octocat/Hello-World")
-    assert df["sha"].count() == 200
-    df = repo_miner.fetch_commits("octocat/Hello-World", None)
-    assert df["sha"].count() == 200
+    gh_instance._repo = DummyRepo(commit_stream(200), [])
+    df = repo_miner.fetch_commits("octocat/Hello-World", **kwargs)
+    assert len(df) == expected
 
 
 def test_fetch_commits_empty(monkeypatch):
@@ -144,7 +333,112 @@ def test_fetch_commits_empty(monkeypatch):
     gh_instance._repo = DummyRepo([], [])
 
     df = repo_miner.fetch_commits("octocat/Hello-World")
-    assert df["sha"].count() == 0
+    assert len(df) == 0
+
+
+def test_fetch_empty_results_are_typed():
+    """Test that empty fetches keep the columns and dtypes of non-empty ones."""
+    gh_instance._repo = DummyRepo([], [])
+
+    commits = repo_miner.fetch_commits("octocat/Hello-World")
+    assert isinstance(commits["author"].dtype, pd.CategoricalDtype)
+
+    issues = repo_miner.fetch_issues("octocat/Hello-World")
+    assert len(issues) == 0
+    assert issues.columns[-1] == "open_duration_days"
+    assert issues["number"].dtype == "int64"
+    assert issues["state"].cat.categories.tolist() == ["open", "closed"]
+
+    # the cached template is never handed out itself
+    issues["title"] = issues["title"].astype(object)
+    assert repo_miner.fetch_issues("octocat/Hello-World")["title"].dtype != object
+
+
+def test_fetch_commits_concurrent_pages():
+    """Test that paginated listings are fetched page-wise and kept in order."""
+    commits = [
+        DummyCommit(f"sha{i}", "Alice", "a@example.com", NOW, "msg") for i in range(250)
+    ]
+    pages = DummyPaginatedList(commits)
+    gh_instance._repo = DummyRepo(pages, [])
+
+    df = repo_miner.fetch_commits("octocat/Hello-World", 230)
+    assert df["sha"].tolist() == [f"sha{i}" for i in range(230)]
+    assert sorted(pages.requested_pages) == [0, 1, 2]
+
+    df = repo_miner.fetch_commits("octocat/Hello-World", 50)
+    assert len(df) == 50
+    assert pages.requested_pages[3:] == [0]
+
+
+def test_commit_rows_stream_pages_as_they_arrive():
+    """Test that rows come out before the rest of a long listing is downloaded."""
+    commits = [
+        DummyCommit(f"sha{i}", "Alice", "a@example.com", NOW, "msg")
+        for i in range(2000)
+    ]
+    pages = DummyPaginatedList(commits)
+    gh_instance._repo = DummyRepo(pages, [])
+
+    rows = repo_miner._commit_rows("octocat/Hello-World", None, graphql=False)
+    assert next(rows)[0] == "sha0"
+    # the first page plus at most one request in flight per worker
+    assert len(pages.requested_pages) <= 2 + repo_miner._PAGE_WORKERS
+    assert [row[0] for row in rows] == [f"sha{i}" for i in range(1, 2000)]
+    assert sorted(pages.requested_pages) == list(range(20))
+
+
+def test_fetch_commits_pages_within_rate_limit(monkeypatch):
+    """Test that concurrent page requests never outnumber the remaining rate limit."""
+    commits = [
+        DummyCommit(f"sha{i}", "Alice", "a@example.com", NOW, "msg")
+        for i in range(1000)
+    ]
+    gh_instance._repo = DummyRepo(DummyPaginatedList(commits), [])
+    monkeypatch.setattr(gh_instance.requester, "rate_limiting", (2, 5000))
+    workers = []
+    real_pool = repo_miner.ThreadPoolExecutor
+
+    def recording_pool(max_workers):
+        workers.append(max_workers)
+        return real_pool(max_workers=max_workers)
+
+    monkeypatch.setattr(repo_miner, "ThreadPoolExecutor", recording_pool)
+
+    df = repo_miner.fetch_commits("octocat/Hello-World")
+    assert len(df) == 1000
+    assert workers == [2]
+
+
+def test_fetch_commits_graphql(monkeypatch):
+    """Test that the GraphQL path pages by cursor and stops at max_commits."""
+    node = {
+        "oid": "sha1",
+        "message": "Initial commit",
+        "author": {
+            "name": "Alice",
+            "email": "a@example.com",
+            "date": "2025-01-01T00:00:00Z",
+        },
+    }
+    monkeypatch.setattr(
+        gh_instance,
+        "requester",
+        DummyRequester(
+            [
+                commit_history_page([node] * 100, end_cursor="c1"),
+                commit_history_page([node] * 50, end_cursor="c2"),
+            ]
+        ),
+    )
+
+    df = repo_miner.fetch_commits("octocat/Hello-World", 150, graphql=True)
+    assert list(df.columns) == ["sha", "author", "email", "date", "message"]
+    assert len(df) == 150
+    assert df.iloc[0]["author"] == "Alice"
+    calls = gh_instance.requester.calls
+    assert [(c["first"], c["cursor"]) for c in calls] == [(100, None), (50, "c1")]
+    assert calls[0]["owner"] == "octocat" and calls[0]["name"] == "Hello-World"
 
 
 # --- Tests for fetch_issues ---
@@ -152,17 +446,16 @@ def test_fetch_commits_empty(monkeypatch):
 
 def test_fetch_issues_excludes_prs(monkeypatch):
     """Test that fetch_issues excludes pull requests."""
-    now = datetime.now()
     issues = [
-        DummyIssue(1, 1, "Bug report", "alice", "open", now, None, 0, is_pr=False),
+        DummyIssue(1, 1, "Bug report", "alice", "open", NOW, None, 0, is_pr=False),
         DummyIssue(
             2,
             2,
             "Feature request",
             "bob",
             "closed",
-            now - timedelta(days=1),
-            now,
+            NOW - timedelta(days=1),
+            NOW,
             3,
             is_pr=True,
         ),
@@ -172,7 +465,7 @@ def test_fetch_issues_excludes_prs(monkeypatch):
             "Another bug",
             "charlie",
             "open",
-            now - timedelta(days=2),
+            NOW - timedelta(days=2),
             None,
             1,
             is_pr=False,
@@ -196,11 +489,65 @@ def test_fetch_issues_excludes_prs(monkeypatch):
     assert df["number"].tolist() == [1, 3]  # PR with number 2 should be excluded
 
 
+def test_fetch_issues_bounded_uses_search():
+    """Test that a bounded fetch asks the search API for issues only."""
+    issues = [
+        DummyIssue(1, 1, "PR", "alice", "open", NOW, None, 0, is_pr=True),
+        DummyIssue(2, 2, "Bug", "bob", "open", NOW, None, 0),
+        DummyIssue(3, 3, "Old bug", "carol", "closed", NOW, NOW, 0),
+        DummyIssue(4, 4, "Another bug", "dave", "open", NOW, None, 0),
+    ]
+    gh_instance._repo = DummyRepo([], issues)
+
+    df = repo_miner.fetch_issues(
+        "octocat/Hello-World", "open", max_issues=2, search=True
+    )
+    assert df["number"].tolist() == [2, 4]
+    assert gh_instance.last_search == (
+        "repo:octocat/Hello-World is:issue state:open",
+        "created",
+        "desc",
+    )
+
+
+def test_fetch_issues_search_is_opt_in(monkeypatch):
+    """Test that bounded fetches list issues unless search is asked for and complete."""
+    issues = [
+        DummyIssue(1, 1, "PR", "alice", "open", NOW, None, 0, is_pr=True),
+        DummyIssue(2, 2, "Bug", "bob", "open", NOW, None, 0),
+    ]
+    gh_instance._repo = DummyRepo([], issues)
+
+    df = repo_miner.fetch_issues("octocat/Hello-World", max_issues=2)
+    assert gh_instance.last_search is None
+    assert gh_instance._repo.last_state == "all"
+    assert df["number"].tolist() == [2]
+
+    # incomplete search results are replaced by the issue listing
+    gh_instance._repo = DummyRepo([], issues)
+    monkeypatch.setattr(gh_instance, "search_incomplete", True)
+    df = repo_miner.fetch_issues("octocat/Hello-World", max_issues=2, search=True)
+    assert gh_instance.last_search is not None
+    assert gh_instance._repo.last_state == "all"
+    assert df["number"].tolist() == [2]
+
+
+def test_search_flag_needs_bounded_max(monkeypatch, capsys):
+    """Test that --search is rejected when the search API can't serve --max."""
+    for limit in ([], ["--max", "1001"]):
+        argv = ["repo_miner.py", "fetch-issues", "--repo", "o/r", "--out", "x.csv"]
+        argv += ["--search", *limit]
+        monkeypatch.setattr("sys.argv", argv)
+        with pytest.raises(SystemExit) as exc:
+            repo_miner.main()
+        assert exc.value.code == 2
+        assert "--search needs a --max of at most 1000" in capsys.readouterr().err
+
+
 def test_fetch_issues_date_normalization(monkeypatch):
     """Test that dates are properly normalized to ISO-8601 format."""
-    now = datetime.now()
-    created_at = now - timedelta(days=5)
-    closed_at = now - timedelta(days=1)
+    created_at = NOW - timedelta(days=5)
+    closed_at = NOW - timedelta(days=1)
 
     issues = [
         DummyIssue(
@@ -221,6 +568,9 @@ def test_fetch_issues_date_normalization(monkeypatch):
     assert isinstance(closed_iso, str)
     assert "T" in created_iso  # ISO format includes T
     assert "T" in closed_iso
+    # GitHub's own ISO-8601 strings are passed through unchanged
+    assert created_iso == iso(created_at)
+    assert closed_iso == iso(closed_at)
 
     # Should be able to parse back to datetime
     parsed_created = datetime.fromisoformat(created_iso.replace("Z", "+00:00"))
@@ -231,9 +581,8 @@ def test_fetch_issues_date_normalization(monkeypatch):
 
 def test_fetch_issues_open_duration_calculation(monkeypatch):
     """Test that open_duration_days is calculated correctly."""
-    now = datetime.now()
-    created_at = now - timedelta(days=10)
-    closed_at = now - timedelta(days=3)
+    created_at = NOW - timedelta(days=10)
+    closed_at = NOW - timedelta(days=3)
 
     issues = [
         DummyIssue(
@@ -253,7 +602,7 @@ def test_fetch_issues_open_duration_calculation(monkeypatch):
             "Open issue",
             "bob",
             "open",
-            now - timedelta(days=5),
+            NOW - timedelta(days=5),
             None,
             0,
             is_pr=False,
@@ -275,6 +624,193 @@ def test_fetch_issues_open_duration_calculation(monkeypatch):
     assert pd.isna(open_issue["open_duration_days"])
 
 
+def test_fetch_issues_state_passed_to_api():
+    """Test that the requested state is filtered by GitHub, not after fetching."""
+    issues = [
+        DummyIssue(1, 1, "Bug", "alice", "closed", NOW - timedelta(days=2), NOW, 0),
+        DummyIssue(2, 2, "Question", "bob", "open", NOW, None, 0),
+    ]
+    gh_instance._repo = DummyRepo([], issues)
+
+    df = repo_miner.fetch_issues("octocat/Hello-World", state="closed")
+    assert gh_instance._repo.last_state == "closed"
+    assert df["state"].tolist() == ["closed"]
+
+    df = repo_miner.fetch_issues(
+        "octocat/Hello-World", state="open", max_issues=10, search=True
+    )
+    assert gh_instance.last_search[0].endswith("state:open")
+    assert df["state"].tolist() == ["open"]
+
+
+def test_fetch_issues_graphql(monkeypatch):
+    """Test that GraphQL issues are normalized like the REST ones."""
+    monkeypatch.setattr(
+        gh_instance, "requester", DummyRequester([issues_page(ISSUE_NODES)])
+    )
+
+    df = repo_miner.fetch_issues("octocat/Hello-World", "all", graphql=True)
+    assert df["state"].tolist() == ["closed", "open"]
+    assert df["user"].tolist() == ["alice", "ghost"]
+    assert df.iloc[0]["open_duration_days"] == 7
+    assert pd.isna(df.iloc[1]["open_duration_days"])
+    assert gh_instance.requester.calls[0]["states"] is None
+
+
+def test_stream_issues_graphql_to_csv(monkeypatch, tmp_path):
+    """Test that streamed GraphQL rows are normalized like the GraphQL DataFrame."""
+    pages = [
+        issues_page(ISSUE_NODES[:1], end_cursor="c1"),
+        issues_page(ISSUE_NODES[1:]),
+    ]
+    monkeypatch.setattr(gh_instance, "requester", DummyRequester(pages))
+    out = tmp_path / "issues.csv"
+
+    count = repo_miner._stream_issues_to_csv(
+        "octocat/Hello-World", "all", None, str(out), graphql=True
+    )
+    assert count == 2
+    streamed = pd.read_csv(out)
+    assert streamed["state"].tolist() == ["closed", "open"]
+    assert streamed["user"].tolist() == ["alice", "ghost"]
+    assert streamed["open_duration_days"].iloc[0] == 7
+    assert pd.isna(streamed["closed_at"].iloc[1])
+
+    monkeypatch.setattr(
+        gh_instance, "requester", DummyRequester([issues_page(ISSUE_NODES)])
+    )
+    expected = repo_miner.fetch_issues("octocat/Hello-World", graphql=True)
+    pd.testing.assert_frame_equal(
+        streamed,
+        pd.read_csv(io.StringIO(expected.to_csv(index=False))),
+    )
+
+
+def test_fetch_commits_graphql_falls_back_to_rest(monkeypatch, tmp_path):
+    """Test that a failing GraphQL query is retried through the REST API."""
+
+    class FailingRequester(DummyRequester):
+        def graphql_query(self, query, variables):
+            raise GithubException(401, {"message": "Bad credentials"})
+
+    commits = [DummyCommit("sha1", "Alice", "a@example.com", NOW, "Initial commit")]
+    gh_instance._repo = DummyRepo(commits, [])
+    monkeypatch.setattr(gh_instance, "requester", FailingRequester([]))
+
+    df = repo_miner.fetch_commits("octocat/Hello-World", graphql=True)
+    assert df["sha"].tolist() == ["sha1"]
+
+    out = tmp_path / "commits.csv"
+    count = repo_miner._stream_commits_to_csv(
+        "octocat/Hello-World", None, str(out), graphql=True
+    )
+    assert count == 1
+
+
+def test_stream_to_csv_keeps_old_file_on_error(tmp_path):
+    """Test that a fetch failing midway leaves neither a partial nor a temp file."""
+    out = tmp_path / "commits.csv"
+    out.write_text("previous run\n")
+
+    def failing_rows():
+        yield ("sha1", "Alice", "a@example.com", iso(NOW), "msg")
+        raise GithubException(502, {"message": "Server Error"})
+
+    with pytest.raises(GithubException):
+        repo_miner._write_csv_rows(failing_rows(), repo_miner._COMMIT_COLUMNS, str(out))
+    assert out.read_text() == "previous run\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["commits.csv"]
+
+
+def test_stream_issues_to_csv_matches_dataframe(tmp_path):
+    """Test that the streaming CSV writer produces the same table as fetch_issues."""
+    issues = [
+        DummyIssue(1, 1, "Bug", "alice", "closed", NOW - timedelta(days=3), NOW, 2),
+        DummyIssue(2, 2, "PR", "bob", "open", NOW, None, 0, is_pr=True),
+        DummyIssue(3, 3, "Question", "carol", "open", NOW, None, 1),
+    ]
+    gh_instance._repo = DummyRepo([], issues)
+    out = tmp_path / "issues.csv"
+
+    count = repo_miner._stream_issues_to_csv(
+        "octocat/Hello-World", "all", None, str(out)
+    )
+    assert count == 2
+
+    streamed = pd.read_csv(out)
+    expected = pd.read_csv(
+        io.StringIO(repo_miner.fetch_issues("octocat/Hello-World").to_csv(index=False))
+    )
+    pd.testing.assert_frame_equal(streamed, expected)
+
+
+def test_github_client_is_shared(monkeypatch):
+    """Test that fetches reuse a single client built with 100 items per page."""
+    built = []
+    monkeypatch.setattr(
+        "github.Github", lambda *a, **kw: built.append(kw) or gh_instance
+    )
+    gh_instance._repo = DummyRepo([], [])
+
+    repo_miner.fetch_commits("octocat/Hello-World")
+    repo_miner.fetch_issues("octocat/Hello-World")
+    assert len(built) == 1
+    assert built[0]["per_page"] == 100
+
+
+def test_write_parquet_round_trip(tmp_path):
+    """Test that Parquet output reads back with parsed dates and durations."""
+    issues = [
+        DummyIssue(1, 1, "Bug", "alice", "closed", NOW - timedelta(days=3), NOW, 2),
+        DummyIssue(2, 2, "Question", "bob", "open", NOW, None, 1),
+    ]
+    gh_instance._repo = DummyRepo([], issues)
+    out = tmp_path / "issues.parquet"
+
+    df = repo_miner.fetch_issues("octocat/Hello-World", parse_dates=True)
+    # the timestamps the duration came from are returned as they were parsed
+    assert str(df["created_at"].dt.tz) == "UTC"
+    assert df.iloc[0]["open_duration_days"] == 3
+    assert repo_miner._write_parquet(df, repo_miner._ISSUES_SCHEMA, str(out)) == 2
+
+    read = repo_miner.csv_to_df(str(out), repo_miner._ISSUES_SCHEMA)
+    assert pd.api.types.is_datetime64_any_dtype(read["created_at"])
+    assert pd.isna(read.iloc[1]["closed_at"])
+    assert read.iloc[0]["open_duration_days"] == 3
+    assert read["state"].cat.categories.tolist() == ["open", "closed"]
+
+
+def test_install_http_cache_next_to_output(tmp_path):
+    """Test that the HTTP cache is stored beside the CSV being written."""
+    repo_miner._install_http_cache(str(tmp_path / "commits.csv"))
+    try:
+        session = requests.Session()
+        assert isinstance(session, requests_cache.CachedSession)
+        assert session.settings.cache_control
+        assert str(session.cache.db_path) == str(tmp_path / ".gh_cache.sqlite")
+    finally:
+        requests_cache.uninstall_cache()
+
+
+def test_csv_to_df_schema(tmp_path):
+    """Test that csv_to_df applies the schema and parses dates while reading."""
+    path = tmp_path / "issues.csv"
+    path.write_text(
+        "id,number,title,user,state,created_at,closed_at,comments\n"
+        "1,101,I1,u1,closed,2025-01-01T00:00:00Z,2025-01-03T00:00:00Z,0\n"
+        '2,102,"multi\nline",u2,open,2025-01-02T00:00:00+00:00,,1\n'
+    )
+
+    df = repo_miner.csv_to_df(str(path), repo_miner._ISSUES_SCHEMA)
+    assert pd.api.types.is_datetime64_any_dtype(df["created_at"])
+    assert pd.api.types.is_datetime64_any_dtype(df["closed_at"])
+    assert pd.isna(df.iloc[1]["closed_at"])
+    assert df.iloc[1]["title"] == "multi\nline"
+    assert df["number"].tolist() == [101, 102]
+    assert isinstance(df["user"].dtype, pd.CategoricalDtype)
+    assert df["state"].cat.categories.tolist() == ["open", "closed"]
+
+
 def test_merge_and_summarize_output(capsys):
     # Prepare test DataFrames
     df_commits = pd.DataFrame(
@@ -317,3 +853,56 @@ def test_merge_and_summarize_output(capsys):
     assert "Issue close rate: 66.67" in captured
     # Check avg open duration
     assert "Avg. issue open duration:" in captured
+
+
+def test_merge_and_summarize_missing_values(capsys):
+    """Test that missing authors/states are handled and empty stats are None."""
+    df_commits = pd.DataFrame(
+        {
+            "sha": ["a", "b", "c"],
+            "author": ["X", None, None],
+            "date": ["2025-01-01T00:00:00"] * 3,
+        }
+    )
+    df_issues = pd.DataFrame(
+        {
+            "state": ["open", None],
+            "created_at": ["2025-01-01T00:00:00", "2025-01-02T00:00:00"],
+            "closed_at": [None, None],
+            "open_duration_days": [None, None],
+        }
+    )
+
+    summary = repo_miner.merge_and_summarize(df_commits, df_issues)
+    assert summary["top_committers"] == {"<unknown>": 2, "X": 1}
+    assert summary["closed_issues"] == 0
+    assert summary["close_rate"] == 0
+    assert summary["avg_open_days"] is None
+    assert "No closed issues" in capsys.readouterr().out
+
+
+def test_summarize_csv_without_durations_or_closed_issues(tmp_path):
+    """Test that an all-empty closed_at read from CSV still subtracts from created_at."""
+    path = tmp_path / "issues.csv"
+    path.write_text(
+        "id,number,title,user,state,created_at,closed_at,comments\n"
+        "1,101,I1,u1,open,2025-01-01T00:00:00Z,,0\n"
+    )
+    df_issues = repo_miner.csv_to_df(str(path), repo_miner._ISSUES_SCHEMA)
+    assert str(df_issues["closed_at"].dt.tz) == "UTC"
+    df_commits = pd.DataFrame({"sha": ["a"], "author": ["X"]})
+
+    summary = repo_miner.merge_and_summarize(df_commits, df_issues)
+    assert summary["closed_issues"] == 0
+    assert summary["avg_open_days"] is None
+
+
+def test_merge_and_summarize_ties_keep_first_appearance():
+    """Test that tied committers are listed in order of appearance, categorical or not."""
+    authors = ["zed", "amy", None, "zed", "amy", None]
+    for dtype in (object, "category"):
+        df_commits = pd.DataFrame({"author": pd.Series(authors, dtype=dtype)})
+        df_issues = pd.DataFrame({"state": [], "open_duration_days": []})
+
+        summary = repo_miner.merge_and_summarize(df_commits, df_issues)
+        assert list(summary["top_committers"]) == ["zed", "amy", "<unknown>"]